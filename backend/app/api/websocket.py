@@ -1,60 +1,448 @@
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from typing import Dict
-import json
+from fastapi.websockets import WebSocketState
+from typing import Any, BinaryIO, Dict, List, Optional
+import io
 import logging
 import asyncio
 import os
 import time
 import wave
+from collections import deque
+from pathlib import Path
+import numpy as np
+import orjson
+import webrtcvad
+from faster_whisper.audio import decode_audio
 from app.services.transcription_service import transcription_service
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Persist raw audio chunks to disk only when explicitly requested (debugging)
+SAVE_RAW = os.getenv("SAVE_RAW", "0") == "1"
+
+# Background transcription - the receive loop only enqueues, workers do the Whisper call
+TRANSCRIBE_WORKERS = int(os.getenv("TRANSCRIBE_WORKERS", "2"))
+TRANSCRIBE_QUEUE_SIZE = int(os.getenv("TRANSCRIBE_QUEUE_SIZE", "32"))
+
+# Outgoing messages a slow client may have waiting before transcription updates are merged
+MAX_PENDING_MESSAGES = 4
+
+# Rolling per-client audio window - confirmed audio is trimmed off the front
+SAMPLE_RATE = 16000
+MAX_BUFFER_SECONDS = float(os.getenv("MAX_BUFFER_SECONDS", "20"))
+COMMIT_LAG_SECONDS = 2.0
+
+# CPU speech gate in front of Whisper - chunks with under 10% voiced 30 ms frames are skipped
+VAD_FRAME_SAMPLES = SAMPLE_RATE * 30 // 1000
+MIN_VOICED_RATIO = 0.10
+vad = webrtcvad.Vad(2)  # Aggressiveness: 0-3 (2 is balanced)
+
+class ClientAudioState:
+    """Rolling audio buffer and commit bookkeeping for one client"""
+    
+    def __init__(self):
+        self.buffer = np.zeros(0, dtype=np.float32)
+        self.buffer_offset = 0.0          # absolute time (s) of buffer[0]
+        self.committed_until = 0.0        # absolute time (s) of the last committed word
+        self.previous_words: List[Dict[str, Any]] = []   # last run's uncommitted hypothesis
+        self.committed: List[Dict[str, Any]] = []        # committed segments for persistence
+        self.pending = False              # a transcription job is already queued
+        self.lock = asyncio.Lock()        # one transcription of this window at a time
+        self.stream_kind: Optional[str] = None     # "pcm", "webm" or "container", set by the first chunk
+        self.webm: Optional["WebMStream"] = None   # incremental decoder for a WebM stream
+    
+    @property
+    def buffer_end(self) -> float:
+        return self.buffer_offset + len(self.buffer) / SAMPLE_RATE
+    
+    def append(self, samples: np.ndarray) -> List[Dict[str, Any]]:
+        """
+        Grow the window. Returns the hypothesis words the hard cap forced out, committed
+        as they stand so they are emitted instead of lost.
+        """
+        self.buffer = np.concatenate((self.buffer, samples))
+        # Hard cap on the window so VRAM stays bounded even if nothing becomes stable
+        overflow = len(self.buffer) - int(MAX_BUFFER_SECONDS * SAMPLE_RATE)
+        if overflow <= 0:
+            return []
+        until = self.buffer_offset + overflow / SAMPLE_RATE
+        forced = [w for w in self.previous_words if w["end"] <= until]
+        if forced:
+            self.committed_until = max(self.committed_until, forced[-1]["end"])
+        self.trim(until)
+        return forced
+    
+    def trim(self, until: float):
+        """Drop audio before absolute time `until`"""
+        cut = int(round((until - self.buffer_offset) * SAMPLE_RATE))
+        if cut <= 0:
+            return
+        self.buffer = self.buffer[cut:]
+        self.buffer_offset += cut / SAMPLE_RATE
+        self.committed_until = max(self.committed_until, self.buffer_offset)
+        self.previous_words = [w for w in self.previous_words if w["end"] > self.committed_until]
+
 class ConnectionManager:
     def __init__(self):
         self.active_connections: Dict[str, WebSocket] = {}
+        self.state: Dict[str, ClientAudioState] = {}
+        self.send_locks: Dict[str, asyncio.Lock] = {}
+        self.outboxes: Dict[str, deque] = {}
+        self.session_dirs: Dict[str, Path] = {}
+        self.recordings: Dict[str, BinaryIO] = {}
+        self.wav_writers: Dict[str, wave.Wave_write] = {}
     
     async def connect(self, websocket: WebSocket, client_id: str):
         await websocket.accept()
         self.active_connections[client_id] = websocket
+        self.state[client_id] = ClientAudioState()
+        self.send_locks[client_id] = asyncio.Lock()
+        self.outboxes[client_id] = deque()
+        
+        # One session directory per connection, created once instead of per chunk
+        if SAVE_RAW:
+            session_dir = Path("recorded_sessions") / f"session_{int(time.time())}_{client_id}"
+            session_dir.mkdir(parents=True, exist_ok=True)
+            self.session_dirs[client_id] = session_dir
+        
         logger.info(f"Client {client_id} connected")
     
     def disconnect(self, client_id: str):
         if client_id in self.active_connections:
             del self.active_connections[client_id]
+            self.close_recording(client_id)
+            self.state.pop(client_id, None)
+            self.send_locks.pop(client_id, None)
+            self.outboxes.pop(client_id, None)
+            self.session_dirs.pop(client_id, None)
             logger.info(f"Client {client_id} disconnected")
     
+    def close_recording(self, client_id: str):
+        """Flush and close the client's recording; PCM recordings get their WAV header sizes patched"""
+        wav_writer = self.wav_writers.pop(client_id, None)
+        recording = self.recordings.pop(client_id, None)
+        try:
+            if wav_writer is not None:
+                wav_writer.close()
+            if recording is not None:
+                recording.close()
+        except Exception as e:
+            logger.error(f"Failed to close recording for {client_id}: {e}")
+    
     async def send_personal_message(self, message: dict, client_id: str):
-        if client_id in self.active_connections:
-            try:
-                await self.active_connections[client_id].send_text(json.dumps(message))
-            except Exception as e:
-                logger.error(f"Failed to send message to {client_id}: {e}")
-                self.disconnect(client_id)
+        outbox = self.outboxes.get(client_id)
+        send_lock = self.send_locks.get(client_id)
+        if outbox is None or send_lock is None:
+            return
+        
+        outbox.append(message)
+        if len(outbox) > MAX_PENDING_MESSAGES:
+            self._coalesce_transcriptions(outbox)
+        
+        # Single writer per connection - whoever holds the lock drains the outbox in order
+        async with send_lock:
+            while outbox:
+                websocket = self.active_connections.get(client_id)
+                if websocket is None:
+                    return
+                try:
+                    # orjson emits UTF-8 bytes directly - no str round trip before the frame is sent
+                    payload = orjson.dumps(outbox.popleft(), option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+                    await websocket.send_bytes(payload)
+                except Exception as e:
+                    logger.error(f"Failed to send message to {client_id}: {e}")
+                    self.disconnect(client_id)
+                    return
+    
+    @staticmethod
+    def _coalesce_transcriptions(outbox: deque):
+        """Merge backed-up transcription messages into one so a slow client's outbox stays bounded"""
+        transcriptions = [m for m in outbox if m.get("type") == "transcription"]
+        if len(transcriptions) < 2:
+            return
+        
+        # Segments are incremental, so merge rather than drop to keep the text intact
+        segments = [seg for m in transcriptions for seg in m["data"].get("transcripts", [])]
+        merged = {
+            "type": "transcription",
+            "data": {**transcriptions[-1]["data"], "transcripts": segments, "total_segments": len(segments)}
+        }
+        others = [m for m in outbox if m.get("type") != "transcription"]
+        outbox.clear()
+        outbox.extend(others)
+        outbox.append(merged)
 
 manager = ConnectionManager()
 
-def save_audio_chunk(data: bytes, client_id: str) -> str:
-    """Save audio data to file"""
+# Container signatures for encoded chunks; anything else is treated as raw PCM
+_WEBM_MAGIC = b"\x1a\x45\xdf\xa3"
+_ENCODED_MAGIC = (b"RIFF", b"OggS", _WEBM_MAGIC, b"fLaC", b"ID3")
+_WEBM_CLUSTER_ID = b"\x1f\x43\xb6\x75"
+
+class WebMStream:
+    """
+    Incremental decoder for a MediaRecorder WebM stream. Only the first chunk carries the
+    EBML header, so every decode is header + the clusters not yet finished; clusters a
+    newer one has superseded are dropped, keeping each decode about one cluster long.
+    """
+    
+    def __init__(self, first_chunk: bytes):
+        cluster = first_chunk.find(_WEBM_CLUSTER_ID)
+        if cluster < 0:
+            self.header, self.pending = first_chunk, b""
+        else:
+            self.header, self.pending = first_chunk[:cluster], first_chunk[cluster:]
+        self.emitted = 0  # samples decoded from `pending` already handed out
+    
+    def _decode(self, body: bytes) -> np.ndarray:
+        return decode_audio(io.BytesIO(self.header + body), sampling_rate=SAMPLE_RATE)
+    
+    def feed(self, chunk: bytes) -> np.ndarray:
+        """Append a chunk and return the samples it completed"""
+        self.pending += chunk
+        if not self.pending:
+            return np.zeros(0, dtype=np.float32)
+        
+        samples = self._decode(self.pending)
+        new_samples = samples[self.emitted:]
+        self.emitted = len(samples)
+        
+        # Everything before the newest cluster start is complete - drop it from the next decode
+        cut = self.pending.rfind(_WEBM_CLUSTER_ID)
+        if cut > 0:
+            done = len(self._decode(self.pending[:cut]))
+            self.pending = self.pending[cut:]
+            self.emitted = max(0, self.emitted - done)
+        return new_samples
+
+def decode_audio_chunk(data: bytes, state: ClientAudioState) -> Optional[np.ndarray]:
+    """Decode an audio chunk in memory to float32 mono 16 kHz samples, following the client's stream"""
+    try:
+        if state.stream_kind is None:
+            # The first chunk decides how the whole stream is read
+            if data.startswith(_WEBM_MAGIC):
+                state.stream_kind = "webm"
+                state.webm = WebMStream(data)
+                return state.webm.feed(b"")
+            state.stream_kind = "container" if data.startswith(_ENCODED_MAGIC) else "pcm"
+        
+        if state.stream_kind == "webm":
+            # Continuation chunks have no header and must all reach the decoder, however small
+            return state.webm.feed(data)
+        
+        if len(data) <= 1000:
+            return None  # tiny chunks carry no usable speech
+        
+        if state.stream_kind == "container":
+            if not data.startswith(_ENCODED_MAGIC):
+                logger.warning("Dropping headerless chunk from a per-chunk container stream")
+                return None
+            # Self-contained WAV/Ogg/FLAC/MP3 chunk - decode straight from memory
+            return decode_audio(io.BytesIO(data), sampling_rate=SAMPLE_RATE)
+        
+        # Raw 16 kHz int16 PCM from the client - no decode needed
+        usable = len(data) - (len(data) % 2)
+        return np.frombuffer(data[:usable], dtype=np.int16).astype(np.float32) / 32768.0
+    except Exception as e:
+        logger.error(f"Failed to decode audio chunk: {e}")
+        return None
+
+def has_speech(samples: np.ndarray) -> bool:
+    """Check whether enough 30 ms frames of a 16 kHz chunk are voiced to be worth a Whisper pass"""
     try:
-        # Create session directory
-        session_dir = os.path.join("recorded_sessions", f"session_{int(time.time())}_{client_id}")
-        os.makedirs(session_dir, exist_ok=True)
+        pcm = (np.clip(samples, -1.0, 1.0) * 32767).astype(np.int16).tobytes()
+        frame_bytes = VAD_FRAME_SAMPLES * 2
+        total = len(pcm) // frame_bytes
+        if total == 0:
+            return False
+        voiced = sum(
+            vad.is_speech(pcm[i * frame_bytes:(i + 1) * frame_bytes], SAMPLE_RATE)
+            for i in range(total)
+        )
+        return voiced >= MIN_VOICED_RATIO * total
+    except Exception as e:
+        logger.warning(f"VAD processing error: {e}")
+        return True  # Default to assuming speech if VAD fails
+
+async def save_audio_chunk(data: bytes, client_id: str, samples: Optional[np.ndarray] = None) -> Optional[str]:
+    """Append audio data to the client's recording without blocking the receive loop"""
+    return await asyncio.to_thread(_save_audio_chunk_sync, data, client_id, samples)
+
+def _save_audio_chunk_sync(data: bytes, client_id: str, samples: Optional[np.ndarray] = None) -> Optional[str]:
+    """
+    Append audio data to the client's single session recording. WebM chunks continue one
+    stream and are appended as-is; everything else lands in a 16 kHz PCM WAV, per-chunk
+    containers (WAV/Ogg/FLAC/MP3, each with its own header) as their decoded samples.
+    """
+    try:
+        session_dir = manager.session_dirs.get(client_id)
+        state = manager.state.get(client_id)
+        if session_dir is None or state is None:
+            return None
         
-        # Save audio file
-        audio_path = os.path.join(session_dir, f"audio_{int(time.time())}.wav")
+        recording = manager.recordings.get(client_id)
+        if recording is None:
+            # Open once per session with a 1 MiB buffer; chunks are appended, not written as new files
+            is_webm = state.stream_kind == "webm"
+            audio_path = session_dir / ("recording.webm" if is_webm else "recording.wav")
+            recording = open(audio_path, 'wb', buffering=1 << 20)
+            manager.recordings[client_id] = recording
+            
+            if not is_webm:
+                # Header is written now and its sizes fixed up when the writer is closed
+                wav_writer = wave.open(recording, 'wb')
+                wav_writer.setnchannels(1)
+                wav_writer.setsampwidth(2)
+                wav_writer.setframerate(16000)
+                manager.wav_writers[client_id] = wav_writer
         
-        # Simple WAV file creation (you might need to adjust based on your audio format)
-        with open(audio_path, 'wb') as f:
-            f.write(data)
+        wav_writer = manager.wav_writers.get(client_id)
+        if wav_writer is None:
+            recording.write(data)
+        elif state.stream_kind == "container":
+            if samples is not None and samples.size:
+                wav_writer.writeframesraw((np.clip(samples, -1.0, 1.0) * 32767).astype(np.int16).tobytes())
+        else:
+            wav_writer.writeframesraw(data)
         
-        return audio_path
+        return recording.name
     except Exception as e:
         logger.error(f"Failed to save audio chunk: {e}")
         return None
 
+transcription_queue: asyncio.Queue = asyncio.Queue(maxsize=TRANSCRIBE_QUEUE_SIZE)
+transcription_workers = []
+
+def _normalize_word(word: str) -> str:
+    return word.strip().strip(".,!?;:").lower()
+
+def commit_stable_words(state: ClientAudioState, transcripts: List[Dict[str, Any]], window_start: float, window_end: float) -> List[Dict[str, Any]]:
+    """
+    Commit the prefix of words that agrees with the previous run and ends well before the live edge.
+    Returns the newly committed words with absolute timestamps.
+    """
+    words = [
+        {**word, "start": word["start"] + window_start, "end": word["end"] + window_start}
+        for segment in transcripts
+        for word in segment.get("words", [])
+    ]
+    # Only words past the committed point are candidates
+    words = [w for w in words if w["end"] > state.committed_until]
+    
+    horizon = window_end - COMMIT_LAG_SECONDS
+    stable = []
+    for current, previous in zip(words, state.previous_words):
+        if current["end"] > horizon or _normalize_word(current["word"]) != _normalize_word(previous["word"]):
+            break
+        stable.append(current)
+    
+    state.previous_words = words[len(stable):]
+    if stable:
+        state.committed_until = stable[-1]["end"]
+        state.trim(state.committed_until)
+    return stable
+
+async def save_committed_words(state: ClientAudioState, words: List[Dict[str, Any]], client_id: str, session_dir: Optional[Path]) -> Optional[Dict[str, Any]]:
+    """Turn committed words into one segment and persist it; returns the message data to send, if any"""
+    if not words:
+        return None
+    segment = {
+        "timestamp": words[0]["start"],
+        "end_timestamp": words[-1]["end"],
+        "text": transcription_service.clean_text("".join(w["word"] for w in words)),
+        "session_id": client_id,
+        "words": words
+    }
+    if not segment["text"]:
+        return None
+    state.committed.append(segment)
+    
+    # Send only the new segment; the persisted transcript holds everything committed so far
+    transcript_data, _ = transcription_service.save_transcript([segment], client_id)
+    if session_dir:
+        await asyncio.to_thread(
+            transcription_service.save_transcript, state.committed, client_id, str(session_dir)
+        )
+    return transcript_data
+
+async def emit_committed_words(state: ClientAudioState, words: List[Dict[str, Any]], client_id: str):
+    """Save and send words committed outside a transcription run, through the worker's path"""
+    transcript_data = await save_committed_words(state, words, client_id, manager.session_dirs.get(client_id))
+    websocket = manager.active_connections.get(client_id)
+    if transcript_data is not None and websocket is not None and websocket.client_state == WebSocketState.CONNECTED:
+        await manager.send_personal_message({
+            "type": "transcription",
+            "data": transcript_data
+        }, client_id)
+
+async def flush_pending_words(client_id: str):
+    """Commit the last uncommitted hypothesis as a final segment before the client goes away"""
+    state = manager.state.get(client_id)
+    if state is None:
+        return
+    try:
+        # Wait for an in-flight transcription so its latest hypothesis is the one flushed
+        async with state.lock:
+            words, state.previous_words = state.previous_words, []
+            if words:
+                state.committed_until = words[-1]["end"]
+                await emit_committed_words(state, words, client_id)
+    except Exception as e:
+        logger.error(f"Failed to flush final words for {client_id}: {e}")
+
+async def transcribe_worker(queue: asyncio.Queue):
+    """Pull client jobs off the queue, transcribe the client's rolling window and send newly committed text"""
+    while True:
+        client_id, session_dir = await queue.get()
+        try:
+            state = manager.state.get(client_id)
+            if state is None:
+                continue
+            
+            async with state.lock:
+                # Snapshot the window; chunks arriving meanwhile queue a fresh job
+                state.pending = False
+                window = state.buffer
+                window_start = state.buffer_offset
+                window_end = state.buffer_end
+                
+                # Whisper is blocking - run it off the event loop
+                transcripts = await asyncio.to_thread(transcription_service.transcribe_array, window, client_id)
+                
+                stable = commit_stable_words(state, transcripts, window_start, window_end)
+                transcript_data = await save_committed_words(state, stable, client_id, session_dir)
+                if transcript_data is None:
+                    continue
+                
+            # Send transcription result back to client
+            await manager.send_personal_message({
+                "type": "transcription",
+                "data": transcript_data
+            }, client_id)
+            
+        except Exception as e:
+            logger.error(f"Transcription error: {e}")
+            await manager.send_personal_message({
+                "type": "error",
+                "message": f"Transcription failed: {str(e)}"
+            }, client_id)
+        finally:
+            queue.task_done()
+
+@router.on_event("startup")
+async def start_transcription_workers():
+    for _ in range(TRANSCRIBE_WORKERS):
+        transcription_workers.append(asyncio.create_task(transcribe_worker(transcription_queue)))
+    logger.info(f"Started {TRANSCRIBE_WORKERS} transcription workers (queue size {TRANSCRIBE_QUEUE_SIZE})")
+
+@router.on_event("shutdown")
+async def stop_transcription_workers():
+    for worker in transcription_workers:
+        worker.cancel()
+    transcription_workers.clear()
+
 @router.websocket("/ws/{client_id}")
 async def websocket_endpoint(websocket: WebSocket, client_id: str):
     await manager.connect(websocket, client_id)
@@ -64,40 +452,46 @@ async def websocket_endpoint(websocket: WebSocket, client_id: str):
             # Receive audio data
             data = await websocket.receive_bytes()
             
-            # Save audio chunk
-            audio_path = save_audio_chunk(data, client_id)
+            # Decode audio chunk in memory, continuing the client's stream
+            state = manager.state.get(client_id)
+            samples = decode_audio_chunk(data, state) if state is not None else None
+            
+            # Optionally keep the raw chunk on disk
+            if SAVE_RAW:
+                await save_audio_chunk(data, client_id, samples)
             
-            # Transcribe using improved service
-            if audio_path and os.path.exists(audio_path) and os.path.getsize(audio_path) > 1000:
+            # Grow the rolling window and hand off to the workers so receive_bytes never waits on Whisper
+            if samples is not None and samples.size and state is not None:
+                if not has_speech(samples):
+                    await manager.send_personal_message({"type": "silence"}, client_id)
+                    # Still feed silence in while words await commit, so they can age past the lag
+                    if not state.previous_words:
+                        continue
+                forced = state.append(samples)
+                if forced:
+                    await emit_committed_words(state, forced, client_id)
+                if state.pending:
+                    # The queued job will pick up these samples too
+                    continue
                 try:
-                    session_dir = os.path.dirname(audio_path)
-                    complete_transcript_path = transcription_service.transcribe_and_save(
-                        audio_path, 
-                        client_id, 
-                        session_dir
-                    )
-                    
-                    # Send transcription result back to client
-                    with open(complete_transcript_path, 'r', encoding='utf-8') as f:
-                        transcript_data = json.load(f)
-                    
-                    await manager.send_personal_message({
-                        "type": "transcription",
-                        "data": transcript_data
-                    }, client_id)
-                    
-                except Exception as e:
-                    logger.error(f"Transcription error: {e}")
+                    # Transcripts are only persisted alongside raw audio (SAVE_RAW=1)
+                    transcription_queue.put_nowait((client_id, manager.session_dirs.get(client_id)))
+                    state.pending = True
+                except asyncio.QueueFull:
+                    # The samples stay in the window; the next chunk queues a job that covers them
+                    logger.warning(f"Transcription queue full, delaying transcription for {client_id}")
                     await manager.send_personal_message({
-                        "type": "error",
-                        "message": f"Transcription failed: {str(e)}"
+                        "type": "backpressure",
+                        "message": "Transcription is falling behind, results will be delayed"
                     }, client_id)
                     
     except WebSocketDisconnect:
+        await flush_pending_words(client_id)
         manager.disconnect(client_id)
         logger.info(f"Client {client_id} disconnected")
     except Exception as e:
         logger.error(f"WebSocket error for client {client_id}: {e}")
+        await flush_pending_words(client_id)
         manager.disconnect(client_id)
 
 @router.get("/health")
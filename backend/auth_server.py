@@ -6,17 +6,47 @@ This server only handles authentication without heavy AI models
 
 from fastapi import FastAPI, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel
 import jwt
 import bcrypt
+import anyio
+import os
 import uuid
 from datetime import datetime, timedelta
 import uvicorn
 import re
+import sys
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+# Logging - request handlers only enqueue records, a background thread writes them to stdout
+class BoundedQueueHandler(QueueHandler):
+    """Drop records instead of blocking a request when the log queue is full"""
+    
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+log_queue = queue.Queue(maxsize=10000)
+_log_stream = logging.StreamHandler(sys.stdout)
+_log_stream.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+log_listener = QueueListener(log_queue, _log_stream)
+log_listener.start()
+atexit.register(log_listener.stop)
+
+logger = logging.getLogger("auth")
+logger.setLevel(logging.INFO)
+logger.addHandler(BoundedQueueHandler(log_queue))
+logger.propagate = False
 
 # Initialize FastAPI app
-app = FastAPI(title="Authentication Server", version="1.0.0")
+app = FastAPI(title="Authentication Server", version="1.0.0", default_response_class=ORJSONResponse)
 
 # CORS middleware
 app.add_middleware(
@@ -30,11 +60,20 @@ app.add_middleware(
 # Simple in-memory database
 users_db = {}
 
+# Normalized (casefolded) email -> user id, kept in step with users_db for O(1) lookups
+email_index: dict[str, str] = {}
+
 # JWT Configuration
 JWT_SECRET_KEY = "your-secret-key-change-in-production"
 JWT_ALGORITHM = "HS256"
 JWT_EXPIRATION_DELTA = timedelta(days=30)
 
+# Email format, compiled once at import
+EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\Z')
+
+# bcrypt cost factor (lower it for local development, keep >= 12 in production)
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
 # Security
 security = HTTPBearer()
 
@@ -61,12 +100,20 @@ class PasswordChange(BaseModel):
 # Helper functions
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt"""
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode('utf-8')
 
 def verify_password(password: str, hashed: str) -> bool:
     """Verify a password against its hash"""
     return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
 
+async def hash_password_async(password: str) -> str:
+    """Hash a password in a worker thread so bcrypt never blocks the event loop"""
+    return await anyio.to_thread.run_sync(hash_password, password)
+
+async def verify_password_async(password: str, hashed: str) -> bool:
+    """Verify a password in a worker thread so bcrypt never blocks the event loop"""
+    return await anyio.to_thread.run_sync(verify_password, password, hashed)
+
 def create_jwt_token(user_data: dict) -> str:
     """Create a JWT token for the user"""
     payload = {
@@ -103,8 +150,11 @@ def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(securit
 async def register_user(user_data: UserRegistration):
     """Register a new user"""
     try:
+        # Normalize the email once and reuse it below
+        email_norm = (user_data.email or "").strip().casefold()
+        
         # Validate input data
-        if not user_data.email or not user_data.email.strip():
+        if not email_norm:
             raise HTTPException(status_code=400, detail="Email is required")
         if not user_data.password or len(user_data.password.strip()) < 6:
             raise HTTPException(status_code=400, detail="Password must be at least 6 characters")
@@ -114,30 +164,30 @@ async def register_user(user_data: UserRegistration):
             raise HTTPException(status_code=400, detail="Last name is required")
         
         # Validate email format
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(email_pattern, user_data.email.strip()):
+        if not EMAIL_RE.match(email_norm):
             raise HTTPException(status_code=400, detail="Invalid email format")
         
         # Check if user already exists
-        for user in users_db.values():
-            if user["email"].lower() == user_data.email.lower().strip():
-                raise HTTPException(status_code=400, detail="Email already registered")
+        if email_norm in email_index:
+            raise HTTPException(status_code=400, detail="Email already registered")
         
         # Create new user
         user_id = str(uuid.uuid4())
-        hashed_password = hash_password(user_data.password.strip())
+        hashed_password = await hash_password_async(user_data.password.strip())
+        now_iso = datetime.utcnow().isoformat()
         
         new_user = {
             "id": user_id,
             "firstName": user_data.firstName.strip(),
             "lastName": user_data.lastName.strip(),
-            "email": user_data.email.lower().strip(),
+            "email": email_norm,
             "password": hashed_password,
-            "createdAt": datetime.utcnow().isoformat(),
-            "updatedAt": datetime.utcnow().isoformat()
+            "createdAt": now_iso,
+            "updatedAt": now_iso
         }
         
         users_db[user_id] = new_user
+        email_index[new_user["email"]] = user_id
         
         # Generate token
         token = create_jwt_token(new_user)
@@ -145,7 +195,7 @@ async def register_user(user_data: UserRegistration):
         # Return user data without password
         user_response = {k: v for k, v in new_user.items() if k != "password"}
         
-        print(f"✅ User registered successfully: {user_data.email}")
+        logger.info(f"✅ User registered successfully: {email_norm}")
         
         return {
             "success": True,
@@ -156,7 +206,7 @@ async def register_user(user_data: UserRegistration):
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Registration error: {str(e)}")
+        logger.error(f"❌ Registration error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 @app.post("/api/auth/login")
@@ -164,17 +214,15 @@ async def login_user(user_data: UserLogin):
     """Login a user"""
     try:
         # Find user by email
-        user_found = None
-        for user in users_db.values():
-            if user["email"].lower() == user_data.email.lower().strip():
-                user_found = user
-                break
+        email_norm = user_data.email.strip().casefold()
+        uid = email_index.get(email_norm)
+        user_found = users_db.get(uid) if uid else None
         
         if not user_found:
             raise HTTPException(status_code=401, detail="Invalid email or password")
         
         # Verify password
-        if not verify_password(user_data.password, user_found["password"]):
+        if not await verify_password_async(user_data.password, user_found["password"]):
             raise HTTPException(status_code=401, detail="Invalid email or password")
         
         # Generate token
@@ -183,7 +231,7 @@ async def login_user(user_data: UserLogin):
         # Return user data without password
         user_response = {k: v for k, v in user_found.items() if k != "password"}
         
-        print(f"✅ User logged in successfully: {user_data.email}")
+        logger.info(f"✅ User logged in successfully: {email_norm}")
         
         return {
             "success": True,
@@ -194,7 +242,7 @@ async def login_user(user_data: UserLogin):
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Login error: {str(e)}")
+        logger.error(f"❌ Login error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 @app.get("/api/auth/profile")
@@ -210,25 +258,35 @@ async def update_profile(profile_data: UserProfile, current_user = Depends(get_c
     """Update user profile"""
     try:
         user_id = current_user["id"]
+        user = users_db[user_id]
+        old_email = user["email"]
+        new_email = profile_data.email.strip().casefold()
+        
+        # Keep the email index consistent when the address changes
+        if new_email != old_email:
+            if email_index.get(new_email, user_id) != user_id:
+                raise HTTPException(status_code=400, detail="Email already taken")
+            email_index.pop(old_email, None)
+            email_index[new_email] = user_id
         
-        # Update user data
-        users_db[user_id].update({
-            "firstName": profile_data.firstName.strip(),
-            "lastName": profile_data.lastName.strip(),
-            "email": profile_data.email.lower().strip(),
-            "updatedAt": datetime.utcnow().isoformat()
-        })
+        # Update user data in place
+        user["firstName"] = profile_data.firstName.strip()
+        user["lastName"] = profile_data.lastName.strip()
+        user["email"] = new_email
+        user["updatedAt"] = datetime.utcnow().isoformat()
         
         # Return updated user data without password
-        updated_user = {k: v for k, v in users_db[user_id].items() if k != "password"}
+        updated_user = {k: v for k, v in user.items() if k != "password"}
         
         return {
             "success": True,
             "user": updated_user
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"❌ Profile update error: {str(e)}")
+        logger.error(f"❌ Profile update error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 @app.post("/api/auth/change-password")
@@ -239,15 +297,15 @@ async def change_password(password_data: PasswordChange, current_user = Depends(
         user = users_db[user_id]
         
         # Verify current password
-        if not verify_password(password_data.currentPassword, user["password"]):
+        if not await verify_password_async(password_data.currentPassword, user["password"]):
             raise HTTPException(status_code=401, detail="Current password is incorrect")
         
         # Hash new password
-        new_hashed_password = hash_password(password_data.newPassword)
+        new_hashed_password = await hash_password_async(password_data.newPassword)
         
         # Update password
-        users_db[user_id]["password"] = new_hashed_password
-        users_db[user_id]["updatedAt"] = datetime.utcnow().isoformat()
+        user["password"] = new_hashed_password
+        user["updatedAt"] = datetime.utcnow().isoformat()
         
         return {
             "success": True,
@@ -257,7 +315,7 @@ async def change_password(password_data: PasswordChange, current_user = Depends(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Password change error: {str(e)}")
+        logger.error(f"❌ Password change error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 @app.get("/health")
@@ -280,4 +338,10 @@ if __name__ == "__main__":
     print("   POST /api/auth/change-password")
     print("   GET  /health")
     
-    uvicorn.run(app, host="localhost", port=8000, log_level="info")
\ No newline at end of file
+    # uvloop + httptools cut per-request/per-frame overhead; uvloop is not available on Windows.
+    # A single worker is kept on purpose: users_db lives in this process's memory.
+    server_options = {}
+    if sys.platform == "linux":
+        server_options = {"loop": "uvloop", "http": "httptools", "ws": "websockets"}
+    
+    uvicorn.run(app, host="localhost", port=8000, log_level="info", **server_options)
\ No newline at end of file
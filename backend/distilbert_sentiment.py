@@ -3,34 +3,59 @@ DistilBERT Sentiment Analysis Module
 Real-time sentiment analysis for meeting transcripts using fine-tuned DistilBERT model
 """
 
+import os
+import re
+import hashlib
+import contextlib
+import threading
 import spacy
 import logging
 import asyncio
+import concurrent.futures
 from typing import List, Dict, Any, Optional
-from collections import defaultdict
-import statistics
+from dataclasses import dataclass, asdict
+from collections import Counter, OrderedDict, defaultdict
 
 # Handle transformers import with better error handling
 try:
-    from transformers import DistilBertTokenizerFast, DistilBertForSequenceClassification, pipeline
+    from transformers import AutoTokenizer, AutoModelForSequenceClassification
     TRANSFORMERS_AVAILABLE = True
 except ImportError as e:
     print(f"Warning: Transformers library not available: {e}")
     TRANSFORMERS_AVAILABLE = False
     # Create dummy classes to prevent import errors
-    DistilBertTokenizerFast = None
-    DistilBertForSequenceClassification = None
-    pipeline = None
+    AutoTokenizer = None
+    AutoModelForSequenceClassification = None
 
 # Handle torch import
 try:
     import torch
     TORCH_AVAILABLE = True
+    
+    # One intra-op thread per request avoids oversubscribing the cores when the server
+    # already runs requests concurrently. This is process-wide: raise TORCH_NUM_THREADS
+    # if other CPU-bound torch models share the process and need more threads.
+    torch.set_num_threads(int(os.getenv("TORCH_NUM_THREADS", "1")))
+    try:
+        torch.set_num_interop_threads(int(os.getenv("TORCH_NUM_INTEROP_THREADS", "1")))
+    except RuntimeError:
+        pass  # already set, or parallel work has started in this process
 except ImportError as e:
     print(f"Warning: PyTorch not available: {e}")
     TORCH_AVAILABLE = False
     torch = None
 
+# Handle ONNX Runtime (optimum) import - optional faster inference backend
+try:
+    from optimum.onnxruntime import ORTModelForSequenceClassification
+    ORT_AVAILABLE = True
+except ImportError:
+    ORT_AVAILABLE = False
+    ORTModelForSequenceClassification = None
+
+# Exported ONNX models are cached here so later starts skip the export
+ONNX_CACHE_DIR = os.getenv("SENTIMENT_ONNX_CACHE", "onnx_cache")
+
 # Handle numpy import
 try:
     import numpy as np
@@ -42,17 +67,89 @@ except ImportError:
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Fallback sentence boundary pattern when spaCy is unavailable
+_SENT_SPLIT_RE = re.compile(r'[.!?]+')
+
+# Per-sentence result while the model is unavailable; copied with the sentence and error filled in
+_UNINIT_RESULT = {
+    "sentence": "",
+    "sentiment": "UNKNOWN",
+    "confidence": 0.0,
+    "positive_score": 0.0,
+    "negative_score": 0.0,
+    "error": "Model not initialized"
+}
+
+@dataclass(slots=True)
+class SentenceResult:
+    """Per-sentence sentiment; converted to a dict only at the API boundary"""
+    sentence: str
+    sentiment: str
+    confidence: float
+    positive_score: float
+    negative_score: float
+    score_difference: float = 0.0
+    length: int = 0
+    error: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        result = asdict(self)
+        if result["error"] is None:
+            del result["error"]
+        return result
+
 class DistilBertSentimentAnalyzer:
     """
     Advanced sentiment analysis using DistilBERT model fine-tuned on SST-2 dataset
     Provides sentence-level and overall sentiment scoring with confidence metrics
     """
     
+    # Factual meeting vocabulary - two or more of these mark a sentence as neutral
+    _NEUTRAL_KEYWORDS = frozenset({
+        'meeting', 'discussed', 'reviewed', 'presented', 'scheduled',
+        'covered', 'reported', 'standard', 'procedure', 'operational',
+        'quarterly', 'budget', 'allocation', 'expenditure', 'team'
+    })
+    # Word-start anchored so plurals/inflections ("meetings", "teams") still count
+    _NEUTRAL_RE = re.compile(r"\b(?:" + "|".join(map(re.escape, sorted(_NEUTRAL_KEYWORDS))) + r")")
+    
+    _RESULT_CACHE_SIZE = 128
+    
+    # Token cap per sentence - spoken sentences sit well below it, and it bounds
+    # attention cost versus DistilBERT's default 512-token window
+    _MAX_TOKENS = 128
+    
+    # (max tokens, batch size) - larger batches for shorter sentences
+    _LENGTH_BUCKETS = ((16, 64), (32, 32), (64, 16), (_MAX_TOKENS, 8))
+    
     def __init__(self):
-        self.model_name = "distilbert-base-uncased-finetuned-sst-2-english"
+        # Full DistilBERT-SST2 on GPU; a 4M-parameter distilled SST-2 model on CPU-only boxes
+        default_model = (
+            "distilbert-base-uncased-finetuned-sst-2-english"
+            if TORCH_AVAILABLE and torch.cuda.is_available()
+            else "philschmid/tiny-bert-sst2-distilled"
+        )
+        self.model_name = os.getenv("SENTIMENT_MODEL", default_model)
         self.tokenizer = None
         self.model = None
-        self.sentiment_pipeline = None
+        self.device = None
+        self._pos_idx = 1
+        self._neg_idx = 0
+        self.use_fp16 = False
+        
+        # CUDA graphs captured per (batch, seq_len) shape; False marks a shape that failed to capture
+        self.use_cuda_graphs = False
+        self.use_torch_compile = False
+        self._cuda_graphs: Dict[tuple, Any] = {}
+        self._graph_pool = None
+        self._graph_lock = threading.Lock()
+        
+        # Models load lazily on first use (or via warm-up at server startup)
+        self._init_lock = threading.Lock()
+        
+        # LRU of transcript hash -> analysis result
+        self._result_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
         self.nlp = None
         self.is_initialized = False
         self.initialization_error = None
@@ -65,15 +162,20 @@ class DistilBertSentimentAnalyzer:
         if not TORCH_AVAILABLE:
             self.initialization_error = "PyTorch not available. Install with: pip install torch"
             return
+    
+    def _ensure_initialized(self) -> bool:
+        """
+        Load the models on first use; concurrent callers wait for the same load
         
-        # Check if CUDA is available for potential GPU acceleration
-        cuda_available = torch and torch.cuda.is_available()
-        
-        # Note: TrainingArguments removed as we only need inference, not training
-        
-        # Initialize models in a thread to avoid blocking
-        import threading
-        threading.Thread(target=self._initialize_models_sync, daemon=True).start()
+        Returns:
+            True if the models are ready
+        """
+        if self.is_initialized:
+            return True
+        with self._init_lock:
+            if not self.is_initialized and not self.initialization_error:
+                self._initialize_models_sync()
+        return self.is_initialized
     
     def _initialize_models_sync(self):
         """Initialize DistilBERT and SpaCy models synchronously"""
@@ -87,31 +189,66 @@ class DistilBertSentimentAnalyzer:
             
             # Load DistilBERT model and tokenizer
             logger.info(f"📥 Loading model: {self.model_name}")
-            self.tokenizer = DistilBertTokenizerFast.from_pretrained(self.model_name)
-            self.model = DistilBertForSequenceClassification.from_pretrained(self.model_name)
+            self.tokenizer = AutoTokenizer.from_pretrained(self.model_name, use_fast=True)
             
-            # Create sentiment analysis pipeline with GPU support if available
+            # Run the model with GPU support if available
             device = 0 if torch.cuda.is_available() else -1
             if device == 0:
                 logger.info("🚀 Using GPU acceleration for sentiment analysis")
             else:
                 logger.info("💻 Using CPU for sentiment analysis")
-                
-            self.sentiment_pipeline = pipeline(
-                "sentiment-analysis", 
-                model=self.model, 
-                tokenizer=self.tokenizer,
-                device=device,
-                top_k=None  # Updated from deprecated return_all_scores=True
-            )
-            
-            # Load SpaCy for sentence splitting
+            
+            # Prefer the fused ONNX Runtime graph; fall back to PyTorch eager
+            ort_model = self._load_onnx_model(device == 0) if ORT_AVAILABLE else None
+            if ort_model is not None:
+                self.model = ort_model
+            else:
+                self.model = AutoModelForSequenceClassification.from_pretrained(self.model_name)
+                if device == 0:
+                    # FP16 weights + TF32 matmuls put the GEMMs on tensor cores; CPU stays FP32
+                    self.model = self.model.to("cuda").half().eval()
+                    self.use_fp16 = True
+                    self.use_cuda_graphs = os.getenv("SENTIMENT_CUDA_GRAPHS", "1") == "1"
+                    torch.backends.cuda.matmul.allow_tf32 = True
+                    torch.backends.cudnn.allow_tf32 = True
+                    torch.set_float32_matmul_precision('high')
+                    
+                    # Opt-in alternative to ONNX: inductor fusion + its own CUDA graphs
+                    if os.getenv("SENTIMENT_TORCH_COMPILE", "0") == "1" and hasattr(torch, "compile"):
+                        self.model = torch.compile(self.model, mode="reduce-overhead", fullgraph=False)
+                        self.use_torch_compile = True
+                        self.use_cuda_graphs = False  # reduce-overhead already captures graphs
+                        logger.info("🧩 Using torch.compile (reduce-overhead) for sentiment analysis")
+                else:
+                    # INT8 dynamic quantization of the Linear layers - int8 GEMMs on CPU, ~4x smaller weights
+                    self.model.eval()
+                    self.model = torch.quantization.quantize_dynamic(
+                        self.model, {torch.nn.Linear}, dtype=torch.qint8
+                    )
+                    logger.info("🗜️ Applied INT8 dynamic quantization for CPU inference")
+            
+            # Model is driven directly (no pipeline); resolve the logit column of each label once
+            self.device = self.model.device
+            label2id = {label.upper(): int(i) for label, i in self.model.config.label2id.items()}
+            self._pos_idx = label2id.get("POSITIVE", 1)
+            self._neg_idx = label2id.get("NEGATIVE", 0)
+            
+            if self.use_torch_compile:
+                self._warm_up_compiled()
+            
+            # Load SpaCy for sentence splitting - only sentence boundaries are used,
+            # so skip loading every statistical component and use the rule-based sentencizer
             try:
-                self.nlp = spacy.load("en_core_web_sm")
+                self.nlp = spacy.load(
+                    "en_core_web_sm",
+                    exclude=["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer", "ner", "senter"]
+                )
+                self.nlp.add_pipe("sentencizer")
                 logger.info("✅ SpaCy model loaded successfully")
             except OSError:
-                logger.warning("⚠️ SpaCy en_core_web_sm not found, using basic sentence splitting")
-                self.nlp = None
+                logger.warning("⚠️ SpaCy en_core_web_sm not found, using blank English sentencizer")
+                self.nlp = spacy.blank("en")
+                self.nlp.add_pipe("sentencizer")
             
             self.is_initialized = True
             logger.info("✅ DistilBERT sentiment analysis initialized successfully")
@@ -120,24 +257,74 @@ class DistilBertSentimentAnalyzer:
             self.initialization_error = str(e)
             logger.error(f"❌ Failed to initialize DistilBERT sentiment analysis: {e}")
     
-    def split_into_sentences(self, text: str) -> List[str]:
+    def _load_onnx_model(self, use_cuda: bool):
+        """
+        Load the ONNX export of the model, exporting and caching it on first use
+        
+        Args:
+            use_cuda: Run on the CUDA (or TensorRT) execution provider instead of CPU
+            
+        Returns:
+            ORT model, or None if ONNX Runtime could not be used
+        """
+        try:
+            if use_cuda and os.getenv("SENTIMENT_USE_TENSORRT", "0") == "1":
+                provider = "TensorrtExecutionProvider"
+                provider_options = {
+                    "trt_fp16_enable": True,
+                    "trt_engine_cache_enable": True,
+                    "trt_engine_cache_path": os.path.join(ONNX_CACHE_DIR, "trt_engines")
+                }
+            else:
+                provider = "CUDAExecutionProvider" if use_cuda else "CPUExecutionProvider"
+                provider_options = None
+            
+            cache_path = os.path.join(ONNX_CACHE_DIR, self.model_name)
+            if os.path.exists(os.path.join(cache_path, "model.onnx")):
+                logger.info(f"📦 Loading cached ONNX model from {cache_path}")
+                ort_model = ORTModelForSequenceClassification.from_pretrained(
+                    cache_path, provider=provider, provider_options=provider_options
+                )
+            else:
+                logger.info(f"🔄 Exporting {self.model_name} to ONNX (one-time)")
+                ort_model = ORTModelForSequenceClassification.from_pretrained(
+                    self.model_name, export=True, provider=provider, provider_options=provider_options
+                )
+                ort_model.save_pretrained(cache_path)
+            
+            logger.info(f"⚡ Using ONNX Runtime ({provider}) for sentiment analysis")
+            return ort_model
+            
+        except Exception as e:
+            logger.warning(f"⚠️ ONNX Runtime unavailable, using PyTorch: {e}")
+            return None
+    
+    def _inference_context(self):
+        """No-grad inference, with FP16 autocast when the GPU model is in half precision"""
+        stack = contextlib.ExitStack()
+        stack.enter_context(torch.inference_mode())
+        if self.use_fp16:
+            stack.enter_context(torch.autocast("cuda", dtype=torch.float16))
+        return stack
+    
+    def split_into_sentences(self, text: str, min_len: int = 1) -> List[str]:
         """
         Split text into sentences using SpaCy or fallback method
         
         Args:
             text: Input text to split
+            min_len: Drop sentences shorter than this many characters (after stripping)
             
         Returns:
             List of sentences
         """
         if self.nlp:
             doc = self.nlp(text)
-            return [sent.text.strip() for sent in doc.sents if sent.text.strip()]
+            return [t for sent in doc.sents if len(t := sent.text.strip()) >= min_len]
         else:
             # Fallback: simple sentence splitting
-            import re
-            sentences = re.split(r'[.!?]+', text)
-            return [sent.strip() for sent in sentences if sent.strip()]
+            parts = _SENT_SPLIT_RE.split(text)
+            return [p for p in map(str.strip, parts) if len(p) >= min_len]
     
     def analyze_sentence_sentiment(self, sentence: str) -> Dict[str, Any]:
         """
@@ -149,82 +336,235 @@ class DistilBertSentimentAnalyzer:
         Returns:
             Dict with sentiment label, confidence, and raw scores
         """
-        if not self.is_initialized:
-            return {
-                "sentence": sentence,
-                "sentiment": "UNKNOWN",
-                "confidence": 0.0,
-                "positive_score": 0.0,
-                "negative_score": 0.0,
-                "error": self.initialization_error or "Model not initialized"
-            }
+        if not self._ensure_initialized() or self.model is None:
+            return dict(_UNINIT_RESULT, sentence=sentence, error=self.initialization_error or _UNINIT_RESULT["error"])
         
         try:
             # Get predictions with all scores
-            results = self.sentiment_pipeline(sentence)
-            
-            # Extract scores for both labels
-            scores = {result['label']: result['score'] for result in results[0]}
-            positive_score = scores.get('POSITIVE', 0.0)
-            negative_score = scores.get('NEGATIVE', 0.0)
-            
-            # Very conservative thresholds to prevent overfitting and false positives
-            confidence_threshold = 0.75  # Much higher threshold (was 0.65)
-            neutral_zone = 0.25  # Wider neutral zone (was 0.15)
-            strong_sentiment_threshold = 0.85  # For very confident classifications
-            
-            score_diff = abs(positive_score - negative_score)
-            max_score = max(positive_score, negative_score)
-            
-            # Additional checks for neutral content patterns
-            neutral_keywords = ['meeting', 'discussed', 'reviewed', 'presented', 'scheduled', 
-                              'covered', 'reported', 'standard', 'procedure', 'operational',
-                              'quarterly', 'budget', 'allocation', 'expenditure', 'team']
-            
-            sentence_lower = sentence.lower()
-            neutral_keyword_count = sum(1 for keyword in neutral_keywords if keyword in sentence_lower)
-            has_neutral_pattern = neutral_keyword_count >= 2
-            
-            # Determine sentiment with very conservative approach
-            if (score_diff < neutral_zone or 
-                max_score < confidence_threshold or 
-                has_neutral_pattern):
-                # Scores too close, confidence too low, or neutral pattern detected
-                sentiment = "NEUTRAL"
-                confidence = max_score
-            elif max_score >= strong_sentiment_threshold and score_diff > 0.4:
-                # Only classify as positive/negative if very confident and clear difference
-                if positive_score > negative_score:
-                    sentiment = "POSITIVE"
-                    confidence = positive_score
-                else:
-                    sentiment = "NEGATIVE" 
-                    confidence = negative_score
-            else:
-                # Medium confidence - be conservative
-                sentiment = "NEUTRAL"
-                confidence = max_score
-            
-            return {
-                "sentence": sentence,
-                "sentiment": sentiment,
-                "confidence": confidence,
-                "positive_score": positive_score,
-                "negative_score": negative_score,
-                "score_difference": score_diff,
-                "length": len(sentence.split())
-            }
+            return self._classify_from_scores(sentence, self._forward_batch([sentence])[0]).to_dict()
             
         except Exception as e:
             logger.error(f"Error analyzing sentence sentiment: {e}")
-            return {
-                "sentence": sentence,
-                "sentiment": "ERROR",
-                "confidence": 0.0,
-                "positive_score": 0.0,
-                "negative_score": 0.0,
-                "error": str(e)
-            }
+            return self._error_result(sentence, e).to_dict()
+    
+    def analyze_sentences_sentiment(self, sentences: List[str]) -> List[Dict[str, Any]]:
+        """
+        Analyze a list of sentences with one batched forward pass
+        
+        Args:
+            sentences: Texts to analyze
+            
+        Returns:
+            List of per-sentence results in the same shape as analyze_sentence_sentiment
+        """
+        if not sentences:
+            return []
+        if not self._ensure_initialized() or self.model is None:
+            error = self.initialization_error or _UNINIT_RESULT["error"]
+            return [dict(_UNINIT_RESULT, sentence=sentence, error=error) for sentence in sentences]
+        
+        return [result.to_dict() for result in self._score_sentences(sentences)]
+    
+    def _score_sentences(self, sentences: List[str]) -> List[SentenceResult]:
+        """Batched, length-bucketed scoring; results stay in input order"""
+        try:
+            # Bucket by token length so short sentences aren't padded to the longest one
+            lengths = [len(ids) for ids in self.tokenizer(sentences, truncation=True, max_length=self._MAX_TOKENS)["input_ids"]]
+            order = sorted(range(len(sentences)), key=lengths.__getitem__)
+            
+            batch_scores: List[Optional["np.ndarray"]] = [None] * len(sentences)
+            start = 0
+            for bucket_cap, batch_size in self._LENGTH_BUCKETS:
+                end = start
+                while end < len(order) and lengths[order[end]] <= bucket_cap:
+                    end += 1
+                for i in range(start, end, batch_size):
+                    indices = order[i:min(i + batch_size, end)]
+                    scores = self._forward_batch([sentences[j] for j in indices], max_length=bucket_cap)
+                    # Scatter back into the original sentence order (the trajectory depends on it)
+                    for j, score in zip(indices, scores):
+                        batch_scores[j] = score
+                start = end
+            
+            return [
+                self._classify_from_scores(sentence, scores)
+                for sentence, scores in zip(sentences, batch_scores)
+            ]
+        except Exception as e:
+            # Same model, same failure - report it once for the batch instead of retrying per sentence
+            logger.error(f"Batched sentiment analysis failed: {e}")
+            return [self._error_result(sentence, e) for sentence in sentences]
+    
+    def _forward_batch(self, sentences: List[str], max_length: Optional[int] = None) -> "np.ndarray":
+        """
+        Tokenize once and run a single forward pass over a batch of sentences
+        
+        Args:
+            sentences: Texts to score
+            max_length: Token cap per sentence
+            
+        Returns:
+            Array of label probabilities, one row per sentence
+        """
+        # Compiled models pad to the bucket cap so shapes repeat instead of triggering recompiles
+        enc = self.tokenizer(
+            sentences,
+            padding="max_length" if self.use_torch_compile else True,
+            truncation=True,
+            max_length=max_length or self._MAX_TOKENS,
+            return_tensors="pt"
+        ).to(self.device)
+        
+        logits = self._graph_forward(enc["input_ids"], enc["attention_mask"]) if self.use_cuda_graphs else None
+        with self._inference_context():
+            if logits is None:
+                logits = self.model(**enc).logits
+            return logits.softmax(-1).float().cpu().numpy()
+    
+    def _warm_up_compiled(self):
+        """Compile and settle each bucket shape before the first real request"""
+        try:
+            for bucket_cap, _ in self._LENGTH_BUCKETS:
+                for _ in range(2):
+                    self._forward_batch(["warm up"], max_length=bucket_cap)
+            logger.info("🔥 torch.compile warm-up complete")
+        except Exception as e:
+            logger.warning(f"⚠️ torch.compile warm-up failed, falling back to eager: {e}")
+            self.model = getattr(self.model, "_orig_mod", self.model)
+            self.use_torch_compile = False
+    
+    def _graph_forward(self, input_ids, attention_mask):
+        """
+        Replay a captured CUDA graph for the padded shape of this batch
+        
+        Args:
+            input_ids: Token ids on the GPU, shape (n, seq)
+            attention_mask: Attention mask matching input_ids
+            
+        Returns:
+            Logits for the n real rows, or None to fall back to the eager model
+        """
+        n, seq = input_ids.shape
+        # Round up to a small set of static shapes: power-of-two batch, bucket-cap sequence length
+        static_seq = next((cap for cap, _ in self._LENGTH_BUCKETS if cap >= seq), None)
+        if static_seq is None:
+            return None
+        static_batch = 1 << (n - 1).bit_length()
+        
+        key = (static_batch, static_seq)
+        with self._graph_lock:
+            entry = self._cuda_graphs.get(key)
+            if entry is None:
+                entry = self._capture_graph(static_batch, static_seq)
+                self._cuda_graphs[key] = entry
+            if not entry:
+                return None
+            
+            graph, static_ids, static_mask, static_logits = entry
+            static_ids.zero_()
+            static_mask.zero_()
+            static_ids[:n, :seq].copy_(input_ids)
+            static_mask[:n, :seq].copy_(attention_mask)
+            graph.replay()
+            return static_logits[:n].clone()
+    
+    def _capture_graph(self, batch: int, seq_len: int):
+        """Capture the model forward for one static shape; returns False if capture fails"""
+        try:
+            static_ids = torch.zeros((batch, seq_len), dtype=torch.long, device=self.device)
+            # Some padding in the capture mask so the graph records the masked-attention path
+            static_mask = torch.ones_like(static_ids)
+            static_mask[:, -1] = 0
+            
+            # Warm up on a side stream before capture, as CUDA graphs require
+            stream = torch.cuda.Stream()
+            stream.wait_stream(torch.cuda.current_stream())
+            with torch.cuda.stream(stream), torch.inference_mode():
+                for _ in range(3):
+                    self.model(input_ids=static_ids, attention_mask=static_mask)
+            torch.cuda.current_stream().wait_stream(stream)
+            
+            graph = torch.cuda.CUDAGraph()
+            with torch.inference_mode(), torch.cuda.graph(graph, pool=self._graph_pool):
+                static_logits = self.model(input_ids=static_ids, attention_mask=static_mask).logits
+            if self._graph_pool is None:
+                self._graph_pool = graph.pool()
+            
+            logger.info(f"📸 Captured CUDA graph for sentiment batch={batch} seq_len={seq_len}")
+            return graph, static_ids, static_mask, static_logits
+            
+        except Exception as e:
+            logger.warning(f"⚠️ CUDA graph capture failed for batch={batch} seq_len={seq_len}, using eager: {e}")
+            return False
+    
+    def _classify_from_scores(self, sentence: str, probs: "np.ndarray") -> SentenceResult:
+        """
+        Apply the conservative thresholds to raw model scores for one sentence
+        
+        Args:
+            sentence: Text that was scored
+            probs: Label probabilities for the sentence (one row of _forward_batch)
+            
+        Returns:
+            SentenceResult with sentiment label, confidence, and raw scores
+        """
+        # Extract scores for both labels
+        positive_score = float(probs[self._pos_idx])
+        negative_score = float(probs[self._neg_idx])
+        
+        # Very conservative thresholds to prevent overfitting and false positives
+        confidence_threshold = 0.75  # Much higher threshold (was 0.65)
+        neutral_zone = 0.25  # Wider neutral zone (was 0.15)
+        strong_sentiment_threshold = 0.85  # For very confident classifications
+        
+        score_diff = abs(positive_score - negative_score)
+        max_score = max(positive_score, negative_score)
+        
+        # Additional checks for neutral content patterns (distinct keywords, one regex pass)
+        sentence_lower = sentence.lower()
+        neutral_keyword_count = len(set(self._NEUTRAL_RE.findall(sentence_lower)))
+        has_neutral_pattern = neutral_keyword_count >= 2
+        
+        # Determine sentiment with very conservative approach
+        if (score_diff < neutral_zone or 
+            max_score < confidence_threshold or 
+            has_neutral_pattern):
+            # Scores too close, confidence too low, or neutral pattern detected
+            sentiment = "NEUTRAL"
+            confidence = max_score
+        elif max_score >= strong_sentiment_threshold and score_diff > 0.4:
+            # Only classify as positive/negative if very confident and clear difference
+            if positive_score > negative_score:
+                sentiment = "POSITIVE"
+                confidence = positive_score
+            else:
+                sentiment = "NEGATIVE" 
+                confidence = negative_score
+        else:
+            # Medium confidence - be conservative
+            sentiment = "NEUTRAL"
+            confidence = max_score
+        
+        return SentenceResult(
+            sentence=sentence,
+            sentiment=sentiment,
+            confidence=confidence,
+            positive_score=positive_score,
+            negative_score=negative_score,
+            score_difference=score_diff,
+            length=len(sentence.split())
+        )
+    
+    @staticmethod
+    def _error_result(sentence: str, error: Exception) -> SentenceResult:
+        return SentenceResult(
+            sentence=sentence,
+            sentiment="ERROR",
+            confidence=0.0,
+            positive_score=0.0,
+            negative_score=0.0,
+            error=str(error)
+        )
     
     def analyze_transcript_sentiment(self, transcript: str) -> Dict[str, Any]:
         """
@@ -236,16 +576,41 @@ class DistilBertSentimentAnalyzer:
         Returns:
             Dict with overall sentiment, sentence-level analysis, and statistics
         """
-        if not self.is_initialized:
+        if not self._ensure_initialized() or self.model is None:
             return {
                 "overall_sentiment": "UNKNOWN",
                 "overall_confidence": 0.0,
                 "error": self.initialization_error or "Model not initialized"
             }
         
+        # Identical transcripts (e.g. full analysis followed by the summary) are analyzed once
+        key = hashlib.blake2b(transcript.encode("utf-8"), digest_size=16).hexdigest()
+        with self._cache_lock:
+            cached = self._result_cache.get(key)
+            if cached is not None:
+                self._result_cache.move_to_end(key)
+                return cached
+        
+        result = self._analyze_transcript(transcript)
+        
+        # Errors may be transient, so only successful analyses are cached
+        if "error" not in result:
+            with self._cache_lock:
+                self._result_cache[key] = result
+                if len(self._result_cache) > self._RESULT_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
+        return result
+    
+    def invalidate(self):
+        """Drop all cached transcript analyses"""
+        with self._cache_lock:
+            self._result_cache.clear()
+    
+    def _analyze_transcript(self, transcript: str) -> Dict[str, Any]:
+        """Split, score and aggregate a transcript (uncached)"""
         try:
-            # Split into sentences
-            sentences = self.split_into_sentences(transcript)
+            # Split into sentences, skipping very short ones in the same pass
+            sentences = self.split_into_sentences(transcript, min_len=3)
             
             if not sentences:
                 return {
@@ -256,34 +621,26 @@ class DistilBertSentimentAnalyzer:
                     "statistics": {}
                 }
             
-            # Analyze each sentence
-            sentence_results = []
-            positive_scores = []
-            negative_scores = []
-            confidences = []
-            
-            for sentence in sentences:
-                if len(sentence.strip()) < 3:  # Skip very short sentences
-                    continue
-                    
-                result = self.analyze_sentence_sentiment(sentence)
-                sentence_results.append(result)
-                
-                if "error" not in result:
-                    positive_scores.append(result['positive_score'])
-                    negative_scores.append(result['negative_score'])
-                    confidences.append(result['confidence'])
+            # Analyze all sentences in one batch
+            sentence_results = self._score_sentences(sentences)
+            scored = [r for r in sentence_results if r.error is None]
+            n = len(scored)
             
             # Calculate overall statistics
-            if positive_scores and negative_scores:
-                avg_positive = statistics.mean(positive_scores)
-                avg_negative = statistics.mean(negative_scores)
-                avg_confidence = statistics.mean(confidences)
+            if n:
+                pos = np.fromiter((r.positive_score for r in scored), dtype=np.float64, count=n)
+                neg = np.fromiter((r.negative_score for r in scored), dtype=np.float64, count=n)
+                conf = np.fromiter((r.confidence for r in scored), dtype=np.float64, count=n)
+                
+                avg_positive = float(pos.mean())
+                avg_negative = float(neg.mean())
+                avg_confidence = float(conf.mean())
                 
-                # Calculate sentiment distribution including neutral
-                positive_count = sum(1 for r in sentence_results if r.get('sentiment') == 'POSITIVE')
-                negative_count = sum(1 for r in sentence_results if r.get('sentiment') == 'NEGATIVE')
-                neutral_count = sum(1 for r in sentence_results if r.get('sentiment') == 'NEUTRAL')
+                # Calculate sentiment distribution including neutral (single pass)
+                label_counts = Counter(r.sentiment for r in sentence_results)
+                positive_count = label_counts.get('POSITIVE', 0)
+                negative_count = label_counts.get('NEGATIVE', 0)
+                neutral_count = label_counts.get('NEUTRAL', 0)
                 total_sentences = len(sentence_results)
                 
                 # Conservative overall sentiment determination
@@ -306,10 +663,7 @@ class DistilBertSentimentAnalyzer:
                     overall_confidence = avg_confidence
                 
                 # Sentiment trajectory (how sentiment changes over time)
-                sentiment_trajectory = [
-                    r.get('positive_score', 0) - r.get('negative_score', 0) 
-                    for r in sentence_results if 'error' not in r
-                ]
+                sentiment_trajectory = pos - neg
                 
                 statistics_data = {
                     "sentence_count": total_sentences,
@@ -322,8 +676,8 @@ class DistilBertSentimentAnalyzer:
                     "average_positive_score": avg_positive,
                     "average_negative_score": avg_negative,
                     "average_confidence": avg_confidence,
-                    "sentiment_variance": statistics.variance(sentiment_trajectory) if len(sentiment_trajectory) > 1 else 0,
-                    "sentiment_range": max(sentiment_trajectory) - min(sentiment_trajectory) if sentiment_trajectory else 0,
+                    "sentiment_variance": float(sentiment_trajectory.var(ddof=1)) if n > 1 else 0,
+                    "sentiment_range": float(sentiment_trajectory.max() - sentiment_trajectory.min()),
                     "classification_confidence": "high" if avg_confidence > 0.8 else "medium" if avg_confidence > 0.65 else "low"
                 }
                 
@@ -339,7 +693,7 @@ class DistilBertSentimentAnalyzer:
             return {
                 "overall_sentiment": overall_sentiment,
                 "overall_confidence": overall_confidence,
-                "sentences": sentence_results,
+                "sentences": [r.to_dict() for r in sentence_results],
                 "statistics": statistics_data,
                 "model_info": {
                     "model_name": self.model_name,
@@ -429,6 +783,9 @@ if TRANSFORMERS_AVAILABLE and TORCH_AVAILABLE:
 else:
     distilbert_analyzer = None
 
+# Single worker: sentiment forwards are serialized on the GPU and never run on the event loop
+_SENTIMENT_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="sentiment")
+
 def analyze_sentiment(transcript: str) -> Dict[str, Any]:
     """
     Convenience function for sentiment analysis
@@ -455,4 +812,30 @@ def get_sentiment_summary(transcript: str) -> Dict[str, Any]:
     """
     if not distilbert_analyzer:
         return {"error": "DistilBERT analyzer not available. Check dependencies."}
-    return distilbert_analyzer.get_sentiment_summary(transcript)
\ No newline at end of file
+    return distilbert_analyzer.get_sentiment_summary(transcript)
+
+async def analyze_sentiment_async(transcript: str) -> Dict[str, Any]:
+    """
+    Non-blocking variant of analyze_sentiment for async handlers
+    
+    Args:
+        transcript: Text to analyze
+        
+    Returns:
+        Sentiment analysis results
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_SENTIMENT_EXECUTOR, analyze_sentiment, transcript)
+
+async def get_sentiment_summary_async(transcript: str) -> Dict[str, Any]:
+    """
+    Non-blocking variant of get_sentiment_summary for async handlers
+    
+    Args:
+        transcript: Text to analyze
+        
+    Returns:
+        Simplified sentiment summary
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_SENTIMENT_EXECUTOR, get_sentiment_summary, transcript)